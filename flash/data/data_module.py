@@ -20,7 +20,7 @@ import pytorch_lightning as pl
 import torch
 from pytorch_lightning.trainer.states import RunningStage
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from torch.utils.data import DataLoader, Dataset
+from torch.utils.data import DataLoader, Dataset, Sampler
 from torch.utils.data.dataset import IterableDataset, Subset
 
 from flash.data.auto_dataset import BaseAutoDataset, IterableAutoDataset
@@ -257,17 +257,25 @@ class DataModule(pl.LightningDataModule):
         if isinstance(dataset, (BaseAutoDataset, SplitDataset)):
             return self.data_pipeline.worker_preprocessor(running_stage)
 
-    def _train_dataloader(self) -> DataLoader:
+    def _train_sampler(self, train_ds: Dataset) -> Optional[Sampler]:
+        """Override to use a custom :class:`~torch.utils.data.Sampler` for the training ``DataLoader``. By default
+        (``None``), the training samples are shuffled."""
+        return None
+
+    def _train_dataloader(self, persistent_workers: bool = False) -> DataLoader:
         train_ds: Dataset = self._train_ds() if isinstance(self._train_ds, Callable) else self._train_ds
-        shuffle = not isinstance(train_ds, (IterableDataset, IterableAutoDataset))
+        sampler = self._train_sampler(train_ds)
+        shuffle = sampler is None and not isinstance(train_ds, (IterableDataset, IterableAutoDataset))
         return DataLoader(
             train_ds,
             batch_size=self.batch_size,
             shuffle=shuffle,
+            sampler=sampler,
             num_workers=self.num_workers,
             pin_memory=True,
             drop_last=True,
-            collate_fn=self._resolve_collate_fn(train_ds, RunningStage.TRAINING)
+            collate_fn=self._resolve_collate_fn(train_ds, RunningStage.TRAINING),
+            persistent_workers=persistent_workers and self.num_workers > 0,
         )
 
     def _val_dataloader(self) -> DataLoader:
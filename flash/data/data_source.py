@@ -295,7 +295,7 @@ class PathsDataSource(SequenceDataSource):
         """
         classes = [d.name for d in os.scandir(dir) if d.is_dir()]
         classes.sort()
-        class_to_idx = {cls_name: i for i, cls_name in enumerate(classes)}
+        class_to_idx = dict(zip(classes, range(len(classes))))
         return classes, class_to_idx
 
     @staticmethod
@@ -321,12 +321,15 @@ class PathsDataSource(SequenceDataSource):
 
             data = make_dataset(data, class_to_idx, extensions=self.extensions)
             return [{DefaultDataKeys.INPUT: input, DefaultDataKeys.TARGET: target} for input, target in data]
-        return list(
-            filter(
-                lambda sample: has_file_allowed_extension(sample[DefaultDataKeys.INPUT], self.extensions),
-                super().load_data(data, dataset),
-            )
-        )
+
+        inputs, targets = data
+        if targets is None:
+            return self.predict_load_data(data)
+        # filter before building the samples so that no sample dict is allocated for a skipped file
+        return [{
+            DefaultDataKeys.INPUT: input,
+            DefaultDataKeys.TARGET: target
+        } for input, target in zip(inputs, targets) if has_file_allowed_extension(input, self.extensions)]
 
     def predict_load_data(self,
                           data: Union[str, List[str]],
@@ -337,12 +340,7 @@ class PathsDataSource(SequenceDataSource):
         if not isinstance(data, list):
             data = [data]
 
-        return list(
-            filter(
-                lambda sample: has_file_allowed_extension(sample[DefaultDataKeys.INPUT], self.extensions),
-                super().predict_load_data(data),
-            )
-        )
+        return [{DefaultDataKeys.INPUT: input} for input in data if has_file_allowed_extension(input, self.extensions)]
 
 
 class TensorDataSource(SequenceDataSource[torch.Tensor]):
@@ -13,7 +13,8 @@
 # limitations under the License.
 import os
 from abc import ABC, abstractclassmethod, abstractmethod
-from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, TYPE_CHECKING
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Type, TYPE_CHECKING, Union
 
 import torch
 from pytorch_lightning.trainer.states import RunningStage
@@ -175,6 +176,10 @@ class Preprocess(BasePreprocess, Properties, Module):
                 elif self.predicting:
                     # logic for predicting
 
+    The ``data_sources`` can be given either as :class:`~flash.data.data_source.DataSource` instances or as
+    :class:`~flash.data.data_source.DataSource` classes (or a ``functools.partial`` of one). Data sources given as
+    classes are only constructed the first time they are requested with
+    :meth:`~flash.data.process.Preprocess.data_source_of_name`.
     """
 
     def __init__(
@@ -183,7 +188,7 @@ class Preprocess(BasePreprocess, Properties, Module):
         val_transform: Optional[Dict[str, Callable]] = None,
         test_transform: Optional[Dict[str, Callable]] = None,
         predict_transform: Optional[Dict[str, Callable]] = None,
-        data_sources: Optional[Dict[str, DataSource]] = None,
+        data_sources: Optional[Dict[str, Union[DataSource, Type[DataSource], partial]]] = None,
         default_data_source: Optional[str] = None,
     ):
         super().__init__()
@@ -211,7 +216,8 @@ class Preprocess(BasePreprocess, Properties, Module):
         self._test_transform = convert_to_modules(self.test_transform)
         self._predict_transform = convert_to_modules(self.predict_transform)
 
-        self._data_sources = data_sources
+        # copied so that the data sources built from factories on lookup are never shared with other preprocesses
+        self._data_sources = dict(data_sources or {})
         self._default_data_source = default_data_source
 
         self._callbacks: List[FlashCallback] = []
@@ -403,6 +409,12 @@ class Preprocess(BasePreprocess, Properties, Module):
         """
         return list(self._data_sources.keys())
 
+    @staticmethod
+    def _is_data_source_factory(data_source: Any) -> bool:
+        if isinstance(data_source, partial):
+            data_source = data_source.func
+        return isinstance(data_source, type) and issubclass(data_source, DataSource)
+
     def data_source_of_name(self, data_source_name: str) -> DataSource:
         """Get the :class:`~flash.data.data_source.DataSource` of the given name from the
         :class:`~flash.data.process.Preprocess`.
@@ -421,7 +433,10 @@ class Preprocess(BasePreprocess, Properties, Module):
             data_source_name = self._default_data_source
         data_sources = self._data_sources
         if data_source_name in data_sources:
-            return data_sources[data_source_name]
+            data_source = data_sources[data_source_name]
+            if self._is_data_source_factory(data_source):
+                data_source = data_sources[data_source_name] = data_source()
+            return data_source
         raise MisconfigurationException(
             f"No '{data_source_name}' data source is available for use with the {type(self)}. The available data "
             f"sources are: {', '.join(self.available_data_sources())}."
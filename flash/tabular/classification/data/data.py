@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -23,13 +24,14 @@ from flash.data.callback import BaseDataFetcher
 from flash.data.data_module import DataModule
 from flash.data.data_source import DataSource, DefaultDataKeys, DefaultDataSources
 from flash.data.process import Preprocess
-from flash.tabular.classification.data.dataset import (
-    _compute_normalization,
-    _generate_codes,
-    _pre_transform,
-    _to_cat_vars_numpy,
-    _to_num_vars_numpy,
-)
+from flash.tabular.classification.data.dataset import _compute_normalization, _generate_codes, _pre_transform
+
+
+def _read_csv(file: str, columns: Optional[List[str]] = None) -> DataFrame:
+    """Reads a CSV file, only parsing the given ``columns`` (if any). Columns which are not in the file are ignored so
+    that, for example, the target column can be requested when reading a file to predict on."""
+    usecols = None if columns is None else (lambda column: column in columns)
+    return pd.read_csv(file, usecols=usecols)
 
 
 class TabularDataFrameDataSource(DataSource[DataFrame]):
@@ -75,11 +77,9 @@ class TabularDataFrameDataSource(DataSource[DataFrame]):
         if dataset is not None:
             dataset.num_samples = len(df)
 
-        cat_vars = _to_cat_vars_numpy(df, self.cat_cols)
-        num_vars = _to_num_vars_numpy(df, self.num_cols)
-
-        cat_vars = np.stack(cat_vars, 1)  # if len(cat_vars) else np.zeros((len(self), 0))
-        num_vars = np.stack(num_vars, 1)  # if len(num_vars) else np.zeros((len(self), 0))
+        # convert each block of columns to a single (num_samples, num_cols) array
+        cat_vars = df[self.cat_cols].to_numpy(dtype=np.int64)
+        num_vars = df[self.num_cols].to_numpy(dtype=np.float32)
         return df, cat_vars, num_vars
 
     def load_data(self, data: DataFrame, dataset: Optional[Any] = None):
@@ -97,11 +97,15 @@ class TabularDataFrameDataSource(DataSource[DataFrame]):
 
 class TabularCSVDataSource(TabularDataFrameDataSource):
 
+    @property
+    def columns(self) -> List[str]:
+        return (self.cat_cols or []) + (self.num_cols or []) + [self.target_col]
+
     def load_data(self, data: str, dataset: Optional[Any] = None):
-        return super().load_data(pd.read_csv(data), dataset=dataset)
+        return super().load_data(_read_csv(data, self.columns), dataset=dataset)
 
     def predict_load_data(self, data: str, dataset: Optional[Any] = None):
-        return super().predict_load_data(pd.read_csv(data), dataset=dataset)
+        return super().predict_load_data(_read_csv(data, self.columns), dataset=dataset)
 
 
 class TabularPreprocess(Preprocess):
@@ -210,6 +214,13 @@ class TabularData(DataModule):
 
         return cat_cols or [], num_cols or []
 
+    @staticmethod
+    def _read_csvs(*files: Optional[str], columns: Optional[List[str]] = None) -> List[Optional[DataFrame]]:
+        """Reads the given CSV files concurrently (the pandas parser releases the GIL while tokenizing). ``None`` is
+        returned in place of any file which is ``None``."""
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            return list(executor.map(lambda file: _read_csv(file, columns) if file is not None else None, files))
+
     @classmethod
     def compute_state(
         cls,
@@ -425,14 +436,23 @@ class TabularData(DataModule):
                 train_file="train_data.csv",
             )
         """
+        columns = []
+        for fields in (categorical_fields, numerical_fields, target_fields):
+            if fields is not None:
+                columns += fields if isinstance(fields, list) else [fields]
+
+        train_data_frame, val_data_frame, test_data_frame, predict_data_frame = cls._read_csvs(
+            train_file, val_file, test_file, predict_file, columns=columns
+        )
+
         return cls.from_data_frame(
             categorical_fields,
             numerical_fields,
             target_fields,
-            train_data_frame=pd.read_csv(train_file) if train_file is not None else None,
-            val_data_frame=pd.read_csv(val_file) if val_file is not None else None,
-            test_data_frame=pd.read_csv(test_file) if test_file is not None else None,
-            predict_data_frame=pd.read_csv(predict_file) if predict_file is not None else None,
+            train_data_frame=train_data_frame,
+            val_data_frame=val_data_frame,
+            test_data_frame=test_data_frame,
+            predict_data_frame=predict_data_frame,
             is_regression=is_regression,
             preprocess=preprocess,
             val_split=val_split,
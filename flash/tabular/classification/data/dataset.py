@@ -24,11 +24,9 @@ from flash.data.utils import download_data
 
 
 def _impute(dfs: List, num_cols: List) -> list:
-    dfs = [df.copy() for df in dfs]
-    for col in num_cols:
-        for df in dfs:
-            df[col] = df[col].fillna(dfs[0][col].median())
-    return dfs
+    # compute the medians of the first df once, then fill all of its numerical columns in a single call per df
+    medians = dfs[0][num_cols].median().to_dict()
+    return [df.fillna(medians) for df in dfs]
 
 
 def _compute_normalization(df: DataFrame, num_cols: List) -> Tuple:
@@ -60,23 +58,17 @@ def _generate_codes(dfs: List, cat_cols: List) -> dict:
 
 
 def _categorize(dfs: List, cat_cols: List, codes: Dict = None) -> list:
-    # combine all dfs together so categories are the same
-    tmp = pd.concat([df.copy() for df in dfs], keys=range(len(dfs)))
-    for col in cat_cols:
-        tmp[col] = tmp[col].astype("category").cat.as_ordered()
-
     no_codes = codes is None
     if no_codes:
-        codes = {col: [None] + list(tmp[col].cat.categories) for col in cat_cols}
-
-    # apply codes to each column
-    tmp[cat_cols] = tmp[cat_cols].apply(lambda x: x.cat.codes)
+        codes = _generate_codes(dfs, cat_cols)
 
-    # we add one here as Nones are -1, so they turn into 0's
-    tmp[cat_cols] = tmp[cat_cols] + 1
+    dfs = [df.copy() for df in dfs]
+    for col in cat_cols:
+        # map each value straight to its index in ``codes``; Nones and unseen values are -1, so they turn into 0's
+        categories = codes[col][1:]
+        for df in dfs:
+            df[col] = pd.Categorical(df[col], categories=categories).codes + 1
 
-    # split dfs
-    dfs = [tmp.xs(i) for i in range(len(dfs))]
     if no_codes:
         return dfs, codes
     return dfs
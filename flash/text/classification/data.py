@@ -44,8 +44,14 @@ class TextDataSource(DataSource):
             ex = ex[input]
         return self.tokenizer(ex, max_length=self.max_length, truncation=True, padding="max_length")
 
-    def _transform_label(self, label_to_class_mapping: Dict[str, int], target: str, ex: Dict[str, Union[int, str]]):
-        ex[target] = label_to_class_mapping[ex[target]]
+    def _transform_label(
+        self,
+        label_to_class_mapping: Dict[str, int],
+        target: str,
+        ex: Dict[str, List[Union[int, str]]],
+    ):
+        """This function is used to map a batch of labels to class indices."""
+        ex[target] = [label_to_class_mapping[label] for label in ex[target]]
         return ex
 
 
@@ -80,7 +86,7 @@ class TextFileDataSource(TextDataSource):
             })
 
         if self.training:
-            labels = list(sorted(list(set(dataset_dict[stage][target]))))
+            labels = sorted(dataset_dict[stage].unique(target))
             dataset.num_classes = len(labels)
             self.set_state(LabelsState(labels))
 
@@ -90,8 +96,11 @@ class TextFileDataSource(TextDataSource):
         # if not self.predicting:
         if labels is not None:
             labels = labels.labels
-            label_to_class_mapping = {v: k for k, v in enumerate(labels)}
-            dataset_dict = dataset_dict.map(partial(self._transform_label, label_to_class_mapping, target))
+            label_to_class_mapping = dict(zip(labels, range(len(labels))))
+            dataset_dict = dataset_dict.map(
+                partial(self._transform_label, label_to_class_mapping, target),
+                batched=True,
+            )
 
         dataset_dict = dataset_dict.map(partial(self._tokenize_fn, input=input), batched=True)
 
@@ -132,7 +141,9 @@ class TextSentencesDataSource(TextDataSource):
 
         if isinstance(data, str):
             data = [data]
-        return [self._tokenize_fn(s, ) for s in data]
+        # tokenize all of the sentences in a single call and then split the batch into samples
+        encoded = self._tokenize_fn(data)
+        return [{key: value[i] for key, value in encoded.items()} for i in range(len(data))]
 
 
 class TextClassificationPreprocess(Preprocess):
@@ -11,19 +11,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import os
-from functools import partial
+from functools import lru_cache, partial
 from typing import Any, Callable, Dict, List, Optional, Union
 
-import datasets
 import torch
-from datasets import DatasetDict, load_dataset
 from torch import Tensor
-from transformers import AutoTokenizer, default_data_collator
+from torch.utils.data import DataLoader, Dataset, Sampler
 
+from flash.data.auto_dataset import AutoDataset
 from flash.data.data_module import DataModule
 from flash.data.data_source import DataSource, DefaultDataSources
 from flash.data.process import Preprocess
+from flash.utils.imports import _DATASETS_AVAILABLE, _TRANSFORMERS_AVAILABLE
+
+if _DATASETS_AVAILABLE:
+    import datasets
+    from datasets import load_dataset
+
+if _TRANSFORMERS_AVAILABLE:
+    from transformers import AutoTokenizer, DataCollatorForSeq2Seq, PreTrainedTokenizerBase
+    from transformers.trainer_pt_utils import DistributedLengthGroupedSampler, LengthGroupedSampler
+
+
+@lru_cache(maxsize=8)
+def _get_tokenizer(backbone: str) -> 'PreTrainedTokenizerBase':
+    # loading a tokenizer reads and parses its files from disk, share a single instance per backbone in each process
+    return AutoTokenizer.from_pretrained(backbone, use_fast=True)
 
 
 class Seq2SeqDataSource(DataSource):
@@ -33,18 +48,20 @@ class Seq2SeqDataSource(DataSource):
         backbone: str,
         max_source_length: int = 128,
         max_target_length: int = 128,
-        padding: Union[str, bool] = 'max_length'
+        padding: Union[str, bool] = False,
+        tokenizer: Optional['PreTrainedTokenizerBase'] = None,
     ):
         super().__init__()
 
-        self.tokenizer = AutoTokenizer.from_pretrained(backbone, use_fast=True)
+        self.backbone = backbone
+        self.tokenizer = tokenizer if tokenizer is not None else _get_tokenizer(backbone)
         self.max_source_length = max_source_length
         self.max_target_length = max_target_length
         self.padding = padding
 
     def _tokenize_fn(
         self,
-        ex: Union[Dict[str, str], str],
+        ex: Union[Dict[str, Union[str, List[str]]], str, List[str]],
         input: Optional[str] = None,
         target: Optional[str] = None,
     ) -> Callable:
@@ -55,13 +72,17 @@ class Seq2SeqDataSource(DataSource):
             ex_input = ex
             ex_target = None
 
-        return self.tokenizer.prepare_seq2seq_batch(
-            src_texts=ex_input,
-            tgt_texts=ex_target,
-            max_length=self.max_source_length,
-            max_target_length=self.max_target_length,
-            padding=self.padding,
-        )
+        # call the tokenizer directly rather than through the deprecated ``prepare_seq2seq_batch`` wrapper
+        output = self.tokenizer(ex_input, max_length=self.max_source_length, padding=self.padding, truncation=True)
+        if ex_target is not None:
+            with self.tokenizer.as_target_tokenizer():
+                output["labels"] = self.tokenizer(
+                    ex_target,
+                    max_length=self.max_target_length,
+                    padding=self.padding,
+                    truncation=True,
+                )["input_ids"]
+        return output
 
 
 class Seq2SeqFileDataSource(Seq2SeqDataSource):
@@ -72,11 +93,28 @@ class Seq2SeqFileDataSource(Seq2SeqDataSource):
         backbone: str,
         max_source_length: int = 128,
         max_target_length: int = 128,
-        padding: Union[str, bool] = 'max_length',
+        padding: Union[str, bool] = False,
+        preprocessing_num_workers: Optional[int] = None,
+        tokenizer: Optional['PreTrainedTokenizerBase'] = None,
     ):
-        super().__init__(backbone, max_source_length, max_target_length, padding)
+        super().__init__(backbone, max_source_length, max_target_length, padding, tokenizer=tokenizer)
 
         self.filetype = filetype
+        self.preprocessing_num_workers = preprocessing_num_workers
+
+    def _cache_file_name(self, dataset: 'datasets.Dataset', input: str, target: Optional[str]) -> Optional[str]:
+        """The fingerprint ``datasets`` computes for the tokenization hashes this data source (and its tokenizer),
+        which is not stable from one run to the next. Instead, key the cached tokenized file on the fingerprint of
+        the raw dataset and the tokenization settings so that it is reused across runs."""
+        if not dataset.cache_files:
+            # in memory datasets are not cached
+            return None
+        key = (
+            f"{dataset._fingerprint}:{self.backbone}:{self.max_source_length}:{self.max_target_length}:"
+            f"{self.padding}:{input}:{target}"
+        )
+        cache_file_name = f"seq2seq-{hashlib.sha1(key.encode()).hexdigest()}.arrow"
+        return os.path.join(os.path.dirname(dataset.cache_files[0]["filename"]), cache_file_name)
 
     def load_data(
         self,
@@ -91,19 +129,25 @@ class Seq2SeqFileDataSource(Seq2SeqDataSource):
 
         # FLASH_TESTING is set in the CI to run faster.
         if use_full and os.getenv("FLASH_TESTING", "0") == "0":
-            dataset_dict = load_dataset(self.filetype, data_files=data_files)
+            dataset = load_dataset(self.filetype, data_files=data_files, split=stage)
         else:
             # used for debugging. Avoid processing the entire dataset   # noqa E265
+            # the split stays backed by its arrow file so that the tokenized result can be cached across runs
             try:
-                dataset_dict = DatasetDict({
-                    stage: load_dataset(self.filetype, data_files=data_files, split=[f'{stage}[:20]'])[0]
-                })
+                dataset = load_dataset(self.filetype, data_files=data_files, split=f'{stage}[:20]')
             except AssertionError:
-                dataset_dict = load_dataset(self.filetype, data_files=data_files)
-
-        dataset_dict = dataset_dict.map(partial(self._tokenize_fn, input=input, target=target), batched=True)
-        dataset_dict.set_format(columns=columns)
-        return dataset_dict[stage]
+                dataset = load_dataset(self.filetype, data_files=data_files, split=stage)
+
+        # the raw text columns are not needed once tokenized, dropping them keeps the cached arrow files small
+        dataset = dataset.map(
+            partial(self._tokenize_fn, input=input, target=target),
+            batched=True,
+            num_proc=self.preprocessing_num_workers,
+            remove_columns=dataset.column_names,
+            cache_file_name=self._cache_file_name(dataset, input, target),
+        )
+        dataset.set_format(columns=columns)
+        return dataset
 
     def predict_load_data(self, data: Any) -> Union['datasets.Dataset', List[Dict[str, torch.Tensor]]]:
         return self.load_data(data, use_full=False, columns=["input_ids", "attention_mask"])
@@ -116,7 +160,9 @@ class Seq2SeqCSVDataSource(Seq2SeqFileDataSource):
         backbone: str,
         max_source_length: int = 128,
         max_target_length: int = 128,
-        padding: Union[str, bool] = 'max_length',
+        padding: Union[str, bool] = False,
+        preprocessing_num_workers: Optional[int] = None,
+        tokenizer: Optional['PreTrainedTokenizerBase'] = None,
     ):
         super().__init__(
             "csv",
@@ -124,6 +170,8 @@ class Seq2SeqCSVDataSource(Seq2SeqFileDataSource):
             max_source_length=max_source_length,
             max_target_length=max_target_length,
             padding=padding,
+            preprocessing_num_workers=preprocessing_num_workers,
+            tokenizer=tokenizer,
         )
 
 
@@ -134,7 +182,9 @@ class Seq2SeqJSONDataSource(Seq2SeqFileDataSource):
         backbone: str,
         max_source_length: int = 128,
         max_target_length: int = 128,
-        padding: Union[str, bool] = 'max_length',
+        padding: Union[str, bool] = False,
+        preprocessing_num_workers: Optional[int] = None,
+        tokenizer: Optional['PreTrainedTokenizerBase'] = None,
     ):
         super().__init__(
             "json",
@@ -142,6 +192,8 @@ class Seq2SeqJSONDataSource(Seq2SeqFileDataSource):
             max_source_length=max_source_length,
             max_target_length=max_target_length,
             padding=padding,
+            preprocessing_num_workers=preprocessing_num_workers,
+            tokenizer=tokenizer,
         )
 
 
@@ -155,7 +207,9 @@ class Seq2SeqSentencesDataSource(Seq2SeqDataSource):
 
         if isinstance(data, str):
             data = [data]
-        return [self._tokenize_fn(s) for s in data]
+        # tokenize all of the sentences in a single call and then split the batch into samples
+        encoded = self._tokenize_fn(data)
+        return [{key: value[i] for key, value in encoded.items()} for i in range(len(data))]
 
 
 class Seq2SeqPreprocess(Preprocess):
@@ -169,12 +223,17 @@ class Seq2SeqPreprocess(Preprocess):
         backbone: str = "sshleifer/tiny-mbart",
         max_source_length: int = 128,
         max_target_length: int = 128,
-        padding: Union[str, bool] = 'max_length'
+        padding: Union[str, bool] = False,
+        preprocessing_num_workers: Optional[int] = None,
     ):
         self.backbone = backbone
         self.max_target_length = max_target_length
         self.max_source_length = max_source_length
         self.padding = padding
+        self.preprocessing_num_workers = preprocessing_num_workers
+
+        # all of the data sources share a single tokenizer
+        tokenizer = _get_tokenizer(self.backbone)
 
         super().__init__(
             train_transform=train_transform,
@@ -187,23 +246,37 @@ class Seq2SeqPreprocess(Preprocess):
                     max_source_length=max_source_length,
                     max_target_length=max_target_length,
                     padding=padding,
+                    preprocessing_num_workers=preprocessing_num_workers,
+                    tokenizer=tokenizer,
                 ),
                 DefaultDataSources.JSON: Seq2SeqJSONDataSource(
                     self.backbone,
                     max_source_length=max_source_length,
                     max_target_length=max_target_length,
                     padding=padding,
+                    preprocessing_num_workers=preprocessing_num_workers,
+                    tokenizer=tokenizer,
                 ),
                 "sentences": Seq2SeqSentencesDataSource(
                     self.backbone,
                     max_source_length=max_source_length,
                     max_target_length=max_target_length,
                     padding=padding,
+                    tokenizer=tokenizer,
                 ),
             },
             default_data_source="sentences",
         )
 
+        # samples are only truncated when tokenized, each batch is then padded to its longest sequence. The labels are
+        # padded with the pad token (rather than -100) so that they can still be decoded for the metrics.
+        self._collator = DataCollatorForSeq2Seq(
+            tokenizer,
+            padding="longest",
+            pad_to_multiple_of=8,
+            label_pad_token_id=tokenizer.pad_token_id,
+        )
+
     def get_state_dict(self) -> Dict[str, Any]:
         return {
             **self.transforms,
@@ -211,6 +284,7 @@ class Seq2SeqPreprocess(Preprocess):
             "max_source_length": self.max_source_length,
             "max_target_length": self.max_target_length,
             "padding": self.padding,
+            "preprocessing_num_workers": self.preprocessing_num_workers,
         }
 
     @classmethod
@@ -219,10 +293,59 @@ class Seq2SeqPreprocess(Preprocess):
 
     def collate(self, samples: Any) -> Tensor:
         """Override to convert a set of samples to a batch"""
-        return default_data_collator(samples)
+        if "labels" in samples[0]:
+            # older versions of ``DataCollatorForSeq2Seq`` pad the labels to the longest one without rounding up to
+            # ``pad_to_multiple_of``, so pad them here to a multiple of it like the inputs, on the tokenizer's side
+            multiple = self._collator.pad_to_multiple_of
+            max_length = max(len(sample["labels"]) for sample in samples)
+            max_length = -(-max_length // multiple) * multiple
+            padding_side = self._collator.tokenizer.padding_side
+            padded_samples = []
+            for sample in samples:
+                labels = list(sample["labels"])
+                padding = [self._collator.label_pad_token_id] * (max_length - len(labels))
+                labels = labels + padding if padding_side == "right" else padding + labels
+                padded_samples.append({**sample, "labels": labels})
+            samples = padded_samples
+        return self._collator(samples)
 
 
 class Seq2SeqData(DataModule):
     """Data module for Seq2Seq tasks."""
 
     preprocess_cls = Seq2SeqPreprocess
+
+    @staticmethod
+    def _input_lengths(dataset: AutoDataset) -> List[int]:
+        if isinstance(dataset.data, datasets.Dataset):
+            # read the whole column at once rather than decoding the samples one by one
+            input_ids = dataset.data["input_ids"]
+        else:
+            input_ids = [sample["input_ids"] for sample in dataset.data]
+        return [len(ids) for ids in input_ids]
+
+    @property
+    def _is_distributed(self) -> bool:
+        trainer = getattr(self, "trainer", None)
+        return trainer is not None and trainer.accelerator_connector.is_distributed
+
+    def _train_sampler(self, train_ds: Dataset) -> Optional[Sampler]:
+        if not isinstance(train_ds, AutoDataset):
+            return None
+
+        # group samples of similar length together so that the dynamically padded batches contain little padding
+        lengths = self._input_lengths(train_ds)
+        if self._is_distributed:
+            # lightning would otherwise raise, as it can only replace the default samplers with a distributed one
+            return DistributedLengthGroupedSampler(
+                dataset=train_ds,
+                batch_size=self.batch_size,
+                num_replicas=self.trainer.world_size,
+                rank=self.trainer.global_rank,
+                lengths=lengths,
+            )
+        return LengthGroupedSampler(dataset=train_ds, batch_size=self.batch_size, lengths=lengths)
+
+    def _train_dataloader(self) -> DataLoader:
+        # keep the workers (and their copy of the tokenizer and collator) alive from one epoch to the next
+        return super()._train_dataloader(persistent_workers=True)
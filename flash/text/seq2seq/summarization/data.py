@@ -13,10 +13,10 @@
 # limitations under the License.
 from typing import Any
 
-from transformers import AutoTokenizer
+import torch
 
 from flash.data.process import Postprocess
-from flash.text.seq2seq.core.data import Seq2SeqData, Seq2SeqPreprocess
+from flash.text.seq2seq.core.data import _get_tokenizer, Seq2SeqData, Seq2SeqPreprocess
 
 
 class SummarizationPostprocess(Postprocess):
@@ -28,12 +28,14 @@ class SummarizationPostprocess(Postprocess):
         super().__init__()
 
         # TODO: Should share the backbone or tokenizer over state
-        self.tokenizer = AutoTokenizer.from_pretrained(backbone, use_fast=True)
+        self.tokenizer = _get_tokenizer(backbone)
 
     def uncollate(self, generated_tokens: Any) -> Any:
+        if isinstance(generated_tokens, torch.Tensor):
+            # ``batch_decode`` converts the sequences one at a time, so copy the whole batch to the host at once instead
+            generated_tokens = generated_tokens.tolist()
         pred_str = self.tokenizer.batch_decode(generated_tokens, skip_special_tokens=True)
-        pred_str = [str.strip(s) for s in pred_str]
-        return pred_str
+        return list(map(str.strip, pred_str))
 
 
 class SummarizationData(Seq2SeqData):
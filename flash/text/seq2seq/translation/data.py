@@ -27,7 +27,8 @@ class TranslationPreprocess(Seq2SeqPreprocess):
         backbone: str = "t5-small",
         max_source_length: int = 128,
         max_target_length: int = 128,
-        padding: Union[str, bool] = 'max_length'
+        padding: Union[str, bool] = False,
+        preprocessing_num_workers: Optional[int] = None,
     ):
         super().__init__(
             train_transform=train_transform,
@@ -38,6 +39,7 @@ class TranslationPreprocess(Seq2SeqPreprocess):
             max_source_length=max_source_length,
             max_target_length=max_target_length,
             padding=padding,
+            preprocessing_num_workers=preprocessing_num_workers,
         )
 
 
@@ -8,3 +8,4 @@ _TORCHVISION_AVAILABLE = _module_available("torchvision")
 _PYTORCHVIDEO_AVAILABLE = _module_available("pytorchvideo")
 _MATPLOTLIB_AVAILABLE = _module_available("matplotlib")
 _TRANSFORMERS_AVAILABLE = _module_available("transformers")
+_DATASETS_AVAILABLE = _module_available("datasets")
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
@@ -18,6 +19,8 @@ import torch
 from PIL import Image
 from pytorch_lightning.trainer.states import RunningStage
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from torch.utils.data import DataLoader
+from torchvision.datasets.folder import default_loader
 
 from flash.data.base_viz import BaseVisualization  # for viz
 from flash.data.callback import BaseDataFetcher
@@ -43,8 +46,14 @@ class ImageClassificationPreprocess(Preprocess):
         test_transform: Optional[Dict[str, Callable]] = None,
         predict_transform: Optional[Dict[str, Callable]] = None,
         image_size: Tuple[int, int] = (196, 196),
+        cache_images: bool = False,
+        loader: Callable[[str], Any] = default_loader,
+        cache_dir: Optional[str] = None,
     ):
         self.image_size = image_size
+        self.cache_images = cache_images
+        self.loader = loader
+        self.cache_dir = cache_dir
 
         super().__init__(
             train_transform=train_transform,
@@ -52,15 +61,25 @@ class ImageClassificationPreprocess(Preprocess):
             test_transform=test_transform,
             predict_transform=predict_transform,
             data_sources={
-                DefaultDataSources.PATHS: ImagePathsDataSource(),
-                DefaultDataSources.NUMPY: ImageNumpyDataSource(),
-                DefaultDataSources.TENSOR: ImageTensorDataSource(),
+                DefaultDataSources.PATHS: partial(
+                    ImagePathsDataSource,
+                    cache_images=cache_images,
+                    loader=loader,
+                    cache_dir=cache_dir,
+                ),
+                DefaultDataSources.NUMPY: ImageNumpyDataSource,
+                DefaultDataSources.TENSOR: ImageTensorDataSource,
             },
             default_data_source=DefaultDataSources.PATHS,
         )
 
     def get_state_dict(self) -> Dict[str, Any]:
-        return {**self.transforms, "image_size": self.image_size}
+        # the loader and cache_dir are local to the machine which created them, so they are not saved with the model
+        return {
+            **self.transforms,
+            "image_size": self.image_size,
+            "cache_images": self.cache_images,
+        }
 
     @classmethod
     def load_state_dict(cls, state_dict: Dict[str, Any], strict: bool = False):
@@ -96,6 +115,11 @@ class ImageClassificationData(DataModule):
     def configure_data_fetcher(*args, **kwargs) -> BaseDataFetcher:
         return MatplotlibVisualization(*args, **kwargs)
 
+    def _train_dataloader(self, persistent_workers: bool = False) -> DataLoader:
+        # each worker holds its own in-memory image cache, so the workers are kept alive from one epoch to the next
+        cache_images = getattr(self.preprocess, "cache_images", False)
+        return super()._train_dataloader(persistent_workers=persistent_workers or cache_images)
+
 
 class MatplotlibVisualization(BaseVisualization):
     """Process and show the image batch and its associated label using matplotlib.
@@ -104,10 +128,12 @@ class MatplotlibVisualization(BaseVisualization):
     block_viz_window: bool = True  # parameter to allow user to block visualisation windows
 
     @staticmethod
-    def _to_numpy(img: Union[torch.Tensor, Image.Image]) -> np.ndarray:
+    def _to_numpy(img: Union[np.ndarray, torch.Tensor, Image.Image]) -> np.ndarray:
         out: np.ndarray
-        if isinstance(img, Image.Image):
-            out = np.array(img)
+        if isinstance(img, np.ndarray):
+            out = img
+        elif isinstance(img, Image.Image):
+            out = np.asarray(img)
         elif isinstance(img, torch.Tensor):
             out = img.squeeze(0).permute(1, 2, 0).cpu().numpy()
         else:
@@ -122,18 +148,26 @@ class MatplotlibVisualization(BaseVisualization):
         if not _MATPLOTLIB_AVAILABLE:
             raise MisconfigurationException("You need matplotlib to visualise. Please, pip install matplotlib")
 
+        # unpack images and labels
+        if isinstance(data, list):
+            imgs = [sample[DefaultDataKeys.INPUT] for sample in data]
+            labels = [sample[DefaultDataKeys.TARGET] for sample in data]
+        elif isinstance(data, dict):
+            imgs, labels = data[DefaultDataKeys.INPUT], data[DefaultDataKeys.TARGET]
+            # move the whole batch to numpy at once rather than one image at a time
+            if isinstance(imgs, torch.Tensor):
+                imgs = imgs.permute(0, 2, 3, 1).cpu().numpy()
+            if isinstance(labels, torch.Tensor):
+                labels = labels.cpu()
+        else:
+            raise TypeError(f"Unknown data type. Got: {type(data)}.")
+
         # create figure and set title
         fig, axs = plt.subplots(rows, cols)
         fig.suptitle(title)
 
         for i, ax in enumerate(axs.ravel()):
-            # unpack images and labels
-            if isinstance(data, list):
-                _img, _label = data[i][DefaultDataKeys.INPUT], data[i][DefaultDataKeys.TARGET]
-            elif isinstance(data, dict):
-                _img, _label = data[DefaultDataKeys.INPUT][i], data[DefaultDataKeys.TARGET][i]
-            else:
-                raise TypeError(f"Unknown data type. Got: {type(data)}.")
+            _img, _label = imgs[i], labels[i]
             # convert images to numpy
             _img: np.ndarray = self._to_numpy(_img)
             if isinstance(_label, torch.Tensor):
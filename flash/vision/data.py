@@ -11,22 +11,92 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Dict, Optional
+import hashlib
+import os
+from typing import Any, Callable, Dict, Optional
 
+import numpy as np
 import torch
+from PIL import Image
 from torchvision.datasets.folder import default_loader, IMG_EXTENSIONS
 from torchvision.transforms.functional import to_pil_image
 
 from flash.data.data_source import DefaultDataKeys, NumpyDataSource, PathsDataSource, TensorDataSource
 
+# the image modes which ``Image.fromarray`` restores from the cached array
+_CACHED_IMAGE_MODES = ("L", "RGB", "RGBA")
+
 
 class ImagePathsDataSource(PathsDataSource):
+    """The ``ImagePathsDataSource`` is a :class:`~flash.data.data_source.PathsDataSource` which loads images from
+    disk.
+
+    Args:
+        cache_images: If ``True``, each decoded image is kept in memory and reused the next time the same file is
+            loaded, so that images are only read and decoded once. Note that each dataloader worker holds its own
+            cache, :class:`~flash.vision.ImageClassificationData` keeps its training workers alive between epochs
+            when ``cache_images`` is set so that their caches are reused.
+        loader: The function used to read and decode an image from a path. Defaults to torchvision's
+            ``default_loader``, which will use Pillow-SIMD when it is installed in place of Pillow, or ``accimage``
+            when selected with ``torchvision.set_image_backend``. The output must be accepted by the transforms.
+        cache_dir: Optionally, a directory in which decoded images are stored as ``.npy`` files. Later loads of the
+            same (unmodified) file memory-map the decoded pixels instead of decoding the image again. The cache is
+            shared between dataloader workers and across runs. Only loaders which return ``PIL`` images in ``L``,
+            ``RGB`` or ``RGBA`` mode are cached.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_images: bool = False,
+        loader: Callable[[str], Any] = default_loader,
+        cache_dir: Optional[str] = None,
+    ):
         super().__init__(extensions=IMG_EXTENSIONS)
 
+        self.cache_images = cache_images
+        self.loader = loader
+        self.cache_dir = cache_dir
+        self._image_cache: Dict[str, Any] = {}
+
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _cache_file(self, path: str) -> str:
+        # the modification time and size are part of the key so that edited images are decoded again, and the loader
+        # so that images decoded by a different loader are never served
+        stat = os.stat(path)
+        loader = getattr(self.loader, "__qualname__", type(self.loader).__qualname__)
+        key = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}:{self.loader.__module__}.{loader}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".npy")
+
+    def _load_image(self, path: str) -> Any:
+        if self.cache_dir is None:
+            return self.loader(path)
+
+        cache_file = self._cache_file(path)
+        if os.path.exists(cache_file):
+            return Image.fromarray(np.load(cache_file, mmap_mode="r"))
+
+        img = self.loader(path)
+        if isinstance(img, Image.Image) and img.mode in _CACHED_IMAGE_MODES:
+            # write to a temporary file first so that other workers never read a partially written array
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                np.save(f, np.asarray(img))
+            os.replace(tmp_file, cache_file)
+        return img
+
     def load_sample(self, sample: Dict[str, Any], dataset: Optional[Any] = None) -> Dict[str, Any]:
-        sample[DefaultDataKeys.INPUT] = default_loader(sample[DefaultDataKeys.INPUT])
+        path = sample[DefaultDataKeys.INPUT]
+        if not self.cache_images:
+            sample[DefaultDataKeys.INPUT] = self._load_image(path)
+            return sample
+
+        img = self._image_cache.get(path)
+        if img is None:
+            img = self._load_image(path)
+            self._image_cache[path] = img
+        sample[DefaultDataKeys.INPUT] = img
         return sample
 
 
@@ -56,14 +56,20 @@ class SemanticSegmentationPathsDataSource(PathsDataSource):
     def __init__(self):
         super().__init__(IMG_EXTENSIONS)
 
+    @staticmethod
+    def _index_files(dir: str) -> Dict[str, str]:
+        """Scans ``dir`` once and returns a mapping from file name to file path."""
+        with os.scandir(dir) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_file()}
+
     def load_data(self, data: Union[Tuple[str, str], Tuple[List[str], List[str]]]) -> Sequence[Mapping[str, Any]]:
         input_data, target_data = data
 
         if self.isdir(input_data) and self.isdir(target_data):
-            input_files = os.listdir(input_data)
-            target_files = os.listdir(target_data)
+            input_files = self._index_files(input_data)
+            target_files = self._index_files(target_data)
 
-            all_files = set(input_files).intersection(set(target_files))
+            all_files = sorted(input_files.keys() & target_files.keys())
 
             if len(all_files) != len(input_files) or len(all_files) != len(target_files):
                 rank_zero_warn(
@@ -72,8 +78,8 @@ class SemanticSegmentationPathsDataSource(PathsDataSource):
                     UserWarning,
                 )
 
-            input_data = [os.path.join(input_data, file) for file in all_files]
-            target_data = [os.path.join(target_data, file) for file in all_files]
+            input_data = [input_files[file] for file in all_files]
+            target_data = [target_files[file] for file in all_files]
 
         if not isinstance(input_data, list) and not isinstance(target_data, list):
             input_data = [input_data]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+from functools import partial
 from unittest.mock import Mock
 
 import pytest
@@ -23,7 +24,7 @@ from flash import Task, Trainer
 from flash.core.classification import Labels, LabelsState
 from flash.data.data_module import DataModule
 from flash.data.data_pipeline import DataPipeline, DataPipelineState, DefaultPreprocess
-from flash.data.data_source import DefaultDataSources
+from flash.data.data_source import DataSource, DefaultDataSources
 from flash.data.process import Serializer, SerializerMapping
 from flash.data.properties import ProcessState, Properties
 
@@ -161,6 +162,35 @@ def test_data_source_of_name():
         preprocess.data_source_of_name("not available")
 
 
+def test_data_source_of_name_lazy():
+
+    class CustomDataSource(DataSource):
+
+        def __init__(self, value: str = "default"):
+            super().__init__()
+            self.value = value
+
+    data_sources = {
+        "class": CustomDataSource,
+        "partial": partial(CustomDataSource, value="partial"),
+    }
+    preprocess = DefaultPreprocess(data_sources=data_sources, default_data_source="class")
+
+    assert preprocess._data_sources["class"] is CustomDataSource
+
+    data_source = preprocess.data_source_of_name("class")
+    assert isinstance(data_source, CustomDataSource)
+    assert data_source.value == "default"
+    assert preprocess.data_source_of_name("default") is data_source
+
+    assert preprocess.data_source_of_name("partial").value == "partial"
+
+    # the built data sources belong to the preprocess, another preprocess sharing the dict builds its own
+    assert data_sources["class"] is CustomDataSource
+    other_preprocess = DefaultPreprocess(data_sources=data_sources, default_data_source="class")
+    assert other_preprocess.data_source_of_name("class") is not data_source
+
+
 def test_available_data_sources():
 
     preprocess = CustomPreprocess()
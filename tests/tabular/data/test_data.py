@@ -12,14 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from flash.data.data_source import DefaultDataKeys
+from flash.data.data_source import DefaultDataKeys, DefaultDataSources
 from flash.tabular import TabularData
+from flash.tabular.classification.data.data import TabularDataFrameDataSource
 from flash.tabular.classification.data.dataset import _categorize, _normalize
 
 TEST_DF_1 = pd.DataFrame(
@@ -50,6 +51,9 @@ def test_categorize():
     assert list(dfs[1]["category"]) == [4, 5, 6]
     assert codes == {"category": [None, "a", "b", "c", "d", "e", "f"]}
 
+    dfs = _categorize([TEST_DF_2], ["category"], codes={"category": [None, "d", "f"]})
+    assert list(dfs[0]["category"]) == [1, 0, 2]
+
 
 def test_normalize():
     num_input = ["scalar_a", "scalar_b"]
@@ -181,6 +185,45 @@ def test_from_csv(tmpdir):
         assert target.shape == (1, )
 
 
+def test_from_csv_predict_without_target(tmpdir):
+    train_csv = Path(tmpdir) / "train.csv"
+    predict_csv = Path(tmpdir) / "predict.csv"
+    TEST_DF_1.to_csv(train_csv)
+    # the file to predict on has no target column and an extra column which is not used
+    TEST_DF_2.drop(columns=["label"]).assign(unused=["x", "y", "z"]).to_csv(predict_csv)
+
+    with patch.object(
+        TabularDataFrameDataSource,
+        "common_load_data",
+        autospec=True,
+        side_effect=TabularDataFrameDataSource.common_load_data,
+    ) as common_load_data:
+        dm = TabularData.from_csv(
+            categorical_fields=["category"],
+            numerical_fields=["scalar_a", "scalar_b"],
+            target_fields="label",
+            train_file=str(train_csv),
+            predict_file=str(predict_csv),
+            num_workers=0,
+            batch_size=1
+        )
+        # predicting on a file goes through the CSV data source
+        samples = dm.preprocess.data_source_of_name(DefaultDataSources.CSV).predict_load_data(str(predict_csv))
+
+    data_frames = [args[1] for args, _ in common_load_data.call_args_list]
+    assert [set(df.columns) for df in data_frames] == [
+        {"category", "scalar_a", "scalar_b", "label"},
+        {"category", "scalar_a", "scalar_b"},
+        {"category", "scalar_a", "scalar_b"},
+    ]
+    assert len(samples) == 3
+
+    data = next(iter(dm.predict_dataloader()))
+    (cat, num) = data[DefaultDataKeys.INPUT]
+    assert cat.shape == (1, 1)
+    assert num.shape == (1, 2)
+
+
 def test_empty_inputs():
     train_data_frame = TEST_DF_1.copy()
     with pytest.raises(RuntimeError):
@@ -13,10 +13,14 @@
 # limitations under the License.
 import os
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
+import torch
+from transformers.trainer_pt_utils import DistributedLengthGroupedSampler, LengthGroupedSampler
 
 from flash.text import SummarizationData
+from flash.text.seq2seq.core.data import Seq2SeqPreprocess
 
 TEST_BACKBONE = "sshleifer/tiny-mbart"  # super small model for testing
 
@@ -82,3 +86,79 @@ def test_from_json(tmpdir):
     batch = next(iter(dm.train_dataloader()))
     assert "labels" in batch
     assert "input_ids" in batch
+
+
+def _round_up(length: int, multiple: int = 8) -> int:
+    return -(-length // multiple) * multiple
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Huggingface timing out on Windows")
+def test_collate_pads_to_longest():
+    preprocess = Seq2SeqPreprocess(backbone=TEST_BACKBONE)
+    data_source = preprocess.data_source_of_name("sentences")
+    pad_token_id = data_source.tokenizer.pad_token_id
+
+    encoded = data_source._tokenize_fn(
+        {
+            "input": ["short", "this is a much longer sentence than the others in the batch", "medium sized one"],
+            "target": ["a much longer target sentence than the other two", "short", "medium target"],
+        },
+        input="input",
+        target="target",
+    )
+    samples = [{key: value[i] for key, value in encoded.items()} for i in range(3)]
+
+    batch = preprocess.collate(samples)
+
+    assert batch["input_ids"].shape == (3, _round_up(max(len(s["input_ids"]) for s in samples)))
+    assert batch["labels"].shape == (3, _round_up(max(len(s["labels"]) for s in samples)))
+    for sample, labels in zip(samples, batch["labels"]):
+        num_labels = len(sample["labels"])
+        assert labels[:num_labels].tolist() == sample["labels"]
+        assert (labels[num_labels:] == pad_token_id).all()
+
+    # the labels are padded on the same side as the inputs
+    tokenizer = preprocess._collator.tokenizer
+    padding_side, tokenizer.padding_side = tokenizer.padding_side, "left"
+    try:
+        batch = preprocess.collate(samples)
+    finally:
+        tokenizer.padding_side = padding_side
+    for sample, labels in zip(samples, batch["labels"]):
+        num_padding = len(labels) - len(sample["labels"])
+        assert labels[num_padding:].tolist() == sample["labels"]
+        assert (labels[:num_padding] == pad_token_id).all()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Huggingface timing out on Windows")
+def test_train_dataloader_groups_by_length(tmpdir):
+    path = Path(tmpdir) / "data.csv"
+    inputs = [" ".join(["word"] * length) for length in (3, 40, 1, 25, 10, 60)]
+    path.write_text("input,target\n" + "".join(f"{text},a target\n" for text in inputs))
+
+    dm = SummarizationData.from_csv(
+        "input",
+        "target",
+        backbone=TEST_BACKBONE,
+        train_file=path,
+        batch_size=2,
+        num_workers=0,
+    )
+
+    dataloader = dm.train_dataloader()
+    assert isinstance(dataloader.sampler, LengthGroupedSampler)
+
+    # the mega batches are drawn at random, only the longest sample is always moved to the front
+    torch.manual_seed(42)
+    lengths = [len(sample["input_ids"]) for sample in dm.train_dataset.data]
+    assert lengths[next(iter(dataloader.sampler))] == max(lengths)
+
+    torch.manual_seed(42)
+    batch = next(iter(dataloader))
+    assert batch["input_ids"].shape[1] == _round_up(max(lengths))
+
+    # lightning can only replace the default samplers in distributed training, so a distributed one is used instead
+    dm.trainer = Mock(accelerator_connector=Mock(is_distributed=True), world_size=2, global_rank=1)
+    sampler = dm.train_dataloader().sampler
+    assert isinstance(sampler, DistributedLengthGroupedSampler)
+    assert (sampler.num_replicas, sampler.rank) == (2, 1)
@@ -14,6 +14,7 @@
 import os
 from pathlib import Path
 from typing import Any, List, Tuple
+from unittest.mock import Mock
 
 import kornia as K
 import numpy as np
@@ -21,6 +22,7 @@ import torch
 import torch.nn as nn
 import torchvision
 from PIL import Image
+from torchvision.datasets.folder import default_loader
 
 from flash.data.data_source import DefaultDataKeys
 from flash.data.data_utils import labels_from_categorical_csv
@@ -115,6 +117,115 @@ def test_from_filepaths_list_image_paths(tmpdir):
     assert list(labels.numpy()) == [2, 5]
 
 
+def test_from_filepaths_cache_images(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    (tmpdir / "c").mkdir()
+    _rand_image().save(tmpdir / "c_1.png")
+    _rand_image().save(tmpdir / "c_2.png")
+
+    train_images = [
+        str(tmpdir / "c_1.png"),
+        str(tmpdir / "c_2.png"),
+    ]
+
+    img_data = ImageClassificationData.from_files(
+        train_files=train_images,
+        train_targets=[0, 1],
+        batch_size=2,
+        num_workers=0,
+        cache_images=True,
+    )
+
+    data_source = img_data.train_dataset.data_source
+    assert data_source.cache_images
+    assert data_source._image_cache == {}
+
+    for _ in range(2):
+        data = next(iter(img_data.train_dataloader()))
+        assert data['input'].shape == (2, 3, 196, 196)
+
+    assert sorted(data_source._image_cache.keys()) == train_images
+
+
+def test_from_filepaths_cache_images_persistent_workers(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    (tmpdir / "p").mkdir()
+    _rand_image().save(tmpdir / "p_1.png")
+    _rand_image().save(tmpdir / "p_2.png")
+
+    train_images = [
+        str(tmpdir / "p_1.png"),
+        str(tmpdir / "p_2.png"),
+    ]
+
+    img_data = ImageClassificationData.from_files(
+        train_files=train_images,
+        train_targets=[0, 1],
+        batch_size=2,
+        num_workers=2,
+        cache_images=True,
+    )
+
+    # the workers, and the images cached in them, are kept from one epoch to the next
+    dataloader = img_data.train_dataloader()
+    assert dataloader.persistent_workers
+    for _ in range(2):
+        data = next(iter(dataloader))
+        assert data['input'].shape == (2, 3, 196, 196)
+
+    img_data = ImageClassificationData.from_files(
+        train_files=train_images,
+        train_targets=[0, 1],
+        batch_size=2,
+        num_workers=2,
+    )
+    assert not img_data.train_dataloader().persistent_workers
+
+
+def test_from_filepaths_cache_dir(tmpdir):
+    tmpdir = Path(tmpdir)
+
+    (tmpdir / "d").mkdir()
+    _rand_image((64, 64)).save(tmpdir / "d_1.png")
+    _rand_image((64, 64)).save(tmpdir / "d_2.png")
+
+    cache_dir = tmpdir / "cache"
+    loader = Mock(wraps=default_loader)
+
+    img_data = ImageClassificationData.from_files(
+        train_files=[str(tmpdir / "d_1.png"), str(tmpdir / "d_2.png")],
+        train_targets=[0, 1],
+        batch_size=2,
+        num_workers=0,
+        loader=loader,
+        cache_dir=str(cache_dir),
+    )
+
+    data = next(iter(img_data.train_dataloader()))
+    assert data['input'].shape == (2, 3, 196, 196)
+    assert len(list(cache_dir.glob("*.npy"))) == 2
+    assert loader.call_count == 2
+
+    # the second pass loads the cached arrays instead of decoding the images again
+    data = next(iter(img_data.train_dataloader()))
+    assert data['input'].shape == (2, 3, 196, 196)
+    assert len(list(cache_dir.glob("*.npy"))) == 2
+    assert loader.call_count == 2
+
+    # images decoded by another loader are cached separately
+    data_source = img_data.train_dataset.data_source
+    other_data_source = type(data_source)(loader=_dummy_image_loader, cache_dir=str(cache_dir))
+    path = str(tmpdir / "d_1.png")
+    assert data_source._cache_file(path) != other_data_source._cache_file(path)
+
+    # the machine local cache directory and loader are not saved with the model
+    state_dict = img_data.preprocess.get_state_dict()
+    assert "cache_dir" not in state_dict
+    assert "loader" not in state_dict
+
+
 def test_from_filepaths_visualise(tmpdir):
     tmpdir = Path(tmpdir)
 
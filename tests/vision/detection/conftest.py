@@ -0,0 +1,23 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from tests.vision.detection.utils import _create_synth_coco_dataset
+
+
+@pytest.fixture(scope="session")
+def coco_dataset(tmp_path_factory):
+    """The synthetic COCO images and annotation file are only read by the tests, so they are written once per
+    session and shared."""
+    return _create_synth_coco_dataset(tmp_path_factory.mktemp("coco"))
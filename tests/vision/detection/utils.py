@@ -0,0 +1,88 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import shutil
+from pathlib import Path
+
+from PIL import Image
+
+# the tests only check the shapes and keys of the batches, so the synthetic images are kept small
+_WIDTH, _HEIGHT = 64, 36
+
+
+def _create_dummy_coco_json(dummy_json_path):
+
+    dummy_json = {
+        "images": [{
+            "id": 0,
+            'width': _WIDTH,
+            'height': _HEIGHT,
+            'file_name': 'sample_one.png',
+        }, {
+            "id": 1,
+            "width": _WIDTH,
+            "height": _HEIGHT,
+            "file_name": "sample_two.png",
+        }],
+        "annotations": [{
+            "id": 1,
+            "image_id": 0,
+            "category_id": 0,
+            "area": 100,
+            "bbox": [2, 3, 10, 10],
+            "iscrowd": 0,
+        }, {
+            "id": 2,
+            "image_id": 1,
+            "category_id": 0,
+            "area": 100,
+            "bbox": [4, 6, 20, 5],
+            "iscrowd": 0,
+        }, {
+            "id": 3,
+            "image_id": 1,
+            "category_id": 0,
+            "area": 240,
+            "bbox": [30, 8, 12, 20],
+            "iscrowd": 0,
+        }],
+        "categories": [{
+            "id": 0,
+            "name": "person",
+            "supercategory": "person",
+        }]
+    }
+
+    with open(dummy_json_path, "w") as fp:
+        json.dump(dummy_json, fp)
+
+
+def _create_synth_coco_dataset(tmpdir):
+    train_dir = Path(tmpdir / "train")
+    train_dir.mkdir()
+
+    (train_dir / "images").mkdir()
+    # both images are blank, so encode the PNG once and copy it
+    Image.new('RGB', (_WIDTH, _HEIGHT)).save(train_dir / "images" / "sample_one.png")
+    shutil.copyfile(train_dir / "images" / "sample_one.png", train_dir / "images" / "sample_two.png")
+
+    (train_dir / "annotations").mkdir()
+    dummy_json = train_dir / "annotations" / "sample.json"
+
+    train_folder = os.fspath(Path(train_dir / "images"))
+    coco_ann_path = os.fspath(dummy_json)
+    _create_dummy_coco_json(coco_ann_path)
+
+    return train_folder, coco_ann_path
@@ -0,0 +1,42 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from copy import deepcopy
+
+import pytest
+
+from flash.data.data_pipeline import DataPipeline
+from flash.vision import SemanticSegmentation
+from flash.vision.segmentation.data import SemanticSegmentationPreprocess
+
+
+@pytest.fixture(scope="module")
+def segmentation_model_factory():
+    """Builds each ``SemanticSegmentation`` configuration (and loads its backbone) only once per test module, so the
+    weights are freed once the module has run. Every call returns a copy, so tests are free to modify the model they
+    get."""
+    cache = {}
+
+    def _make(num_classes: int = 2, backbone: str = "torchvision/fcn_resnet50") -> SemanticSegmentation:
+        key = (num_classes, backbone)
+        if key not in cache:
+            cache[key] = SemanticSegmentation(num_classes=num_classes, backbone=backbone)
+        return deepcopy(cache[key])
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def segmentation_data_pipeline():
+    """A ``DataPipeline`` with the default ``SemanticSegmentationPreprocess``, shared by the tests of a module."""
+    return DataPipeline(preprocess=SemanticSegmentationPreprocess())
@@ -5,10 +5,8 @@ import pytest
 import torch
 
 from flash import Trainer
-from flash.data.data_pipeline import DataPipeline
 from flash.data.data_source import DefaultDataKeys
 from flash.vision import SemanticSegmentation
-from flash.vision.segmentation.data import SemanticSegmentationPreprocess
 
 # ======== Mock functions ========
 
@@ -17,10 +15,14 @@ class DummyDataset(torch.utils.data.Dataset):
     size: Tuple[int, int] = (224, 224)
     num_classes: int = 8
 
+    # only the shapes matter, so every sample shares the same random image and target
+    image = torch.rand(3, *size)
+    target = torch.randint(num_classes - 1, size)
+
     def __getitem__(self, index):
         return {
-            DefaultDataKeys.INPUT: torch.rand(3, *self.size),
-            DefaultDataKeys.TARGET: torch.randint(self.num_classes - 1, self.size),
+            DefaultDataKeys.INPUT: self.image,
+            DefaultDataKeys.TARGET: self.target,
         }
 
     def __len__(self) -> int:
@@ -30,18 +32,22 @@ class DummyDataset(torch.utils.data.Dataset):
 # ==============================
 
 
-def test_smoke():
-    model = SemanticSegmentation(num_classes=1)
+def test_smoke(segmentation_model_factory):
+    model = segmentation_model_factory(num_classes=1)
     assert model is not None
 
 
-@pytest.mark.parametrize("num_classes", [8, 256])
-@pytest.mark.parametrize("img_shape", [(1, 3, 224, 192), (2, 3, 127, 212)])
-def test_forward(num_classes, img_shape):
-    model = SemanticSegmentation(
-        num_classes=num_classes,
-        backbone='torchvision/fcn_resnet50',
-    )
+@pytest.mark.parametrize(
+    "num_classes, img_shape",
+    [
+        (8, (1, 3, 64, 64)),
+        (256, (1, 3, 64, 64)),
+        # odd, non square inputs with a batch of two only need a few classes
+        (2, (2, 3, 127, 212)),
+    ],
+)
+def test_forward(segmentation_model_factory, num_classes, img_shape):
+    model = segmentation_model_factory(num_classes=num_classes, backbone='torchvision/fcn_resnet50')
 
     B, C, H, W = img_shape
     img = torch.rand(B, C, H, W)
@@ -50,6 +56,7 @@ def test_forward(num_classes, img_shape):
     assert out.shape == (B, num_classes, H, W)
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "backbone",
     [
@@ -69,33 +76,25 @@ def test_non_existent_backbone():
         SemanticSegmentation(2, "i am never going to implement this lol")
 
 
-def test_freeze():
-    model = SemanticSegmentation(2)
+def test_freeze_unfreeze(segmentation_model_factory):
+    model = segmentation_model_factory(2)
     model.freeze()
-    for p in model.backbone.parameters():
-        assert p.requires_grad is False
-
-
-def test_unfreeze():
-    model = SemanticSegmentation(2)
+    assert all(p.requires_grad is False for p in model.backbone.parameters())
     model.unfreeze()
-    for p in model.backbone.parameters():
-        assert p.requires_grad is True
+    assert all(p.requires_grad is True for p in model.backbone.parameters())
 
 
-def test_predict_tensor():
+def test_predict_tensor(segmentation_model_factory, segmentation_data_pipeline):
     img = torch.rand(1, 3, 10, 20)
-    model = SemanticSegmentation(2)
-    data_pipe = DataPipeline(preprocess=SemanticSegmentationPreprocess())
-    out = model.predict(img, data_source="tensor", data_pipeline=data_pipe)
+    model = segmentation_model_factory(2)
+    out = model.predict(img, data_source="tensor", data_pipeline=segmentation_data_pipeline)
     assert isinstance(out[0], torch.Tensor)
     assert out[0].shape == (196, 196)
 
 
-def test_predict_numpy():
+def test_predict_numpy(segmentation_model_factory, segmentation_data_pipeline):
     img = np.ones((1, 3, 10, 20))
-    model = SemanticSegmentation(2)
-    data_pipe = DataPipeline(preprocess=SemanticSegmentationPreprocess())
-    out = model.predict(img, data_source="numpy", data_pipeline=data_pipe)
+    model = segmentation_model_factory(2)
+    out = model.predict(img, data_source="numpy", data_pipeline=segmentation_data_pipeline)
     assert isinstance(out[0], torch.Tensor)
     assert out[0].shape == (196, 196)